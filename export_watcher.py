@@ -1,19 +1,183 @@
+import functools
 import os
 import shutil
 import re
 import logging
+import logging.handlers
+import threading
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-# Set up logging
+# Pre-compiled patterns (avoids per-call regex cache lookups in the hot loops)
+_GUID_RE = re.compile(r'\s+[a-f0-9]{32}$')
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_HEADING_PREFIX_RE = re.compile(r'^#+\s*')
+_LINK_RE = re.compile(r'\[.*?\]\((.*?)\)')
+# Bytes twin of _LINK_RE: link targets are URLs (ASCII-safe), so the
+# rewrite can run on raw bytes without a UTF-8 decode/encode round-trip
+_LINK_RE_B = re.compile(rb'\[.*?\]\((.*?)\)')
+_UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+def _strip_guid_suffix(name):
+    """Strip a trailing whitespace + 32-hex-char GUID from a name.
+
+    The common shapes (no GUID at all, or a single space before the GUID)
+    are handled with plain string checks; the precompiled regex is only a
+    fallback for unusual whitespace.
+    """
+    if len(name) >= 33 and _HEX_DIGITS.issuperset(name[-32:]):
+        if name[-33].isspace():
+            return name[:-33].rstrip()
+        return _GUID_RE.sub('', name)
+    return name
+
+
+_COPY_BUFSIZE = 1 << 20
+
+# File copies and reads are I/O bound (the GIL is released during the
+# syscalls), so oversubscribe relative to the core count
+_MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _fast_copy(src_path, dst_path):
+    """Copy src to dst preserving mtime, using in-kernel copies when available.
+
+    Tries os.copy_file_range (server-side / CoW copy on supporting
+    filesystems), then os.sendfile, then a buffered userspace copy.
+    """
+    st = os.stat(src_path)
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        remaining = st.st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            offset = st.st_size - remaining
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            except (AttributeError, OSError):
+                src.seek(offset)
+                shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+    # Preserve timestamps from the single stat above (what copy2 did for us)
+    os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+# Both cleaners are pure, and their inputs repeat heavily (every file in a
+# folder shares the parent name, and re-runs see the same filenames), so
+# memoized module-level functions back the FileProcessor methods.
+@functools.lru_cache(maxsize=256)
+def _clean_parent_folder_name(folder_name):
+    """Clean a parent folder name according to rules."""
+    # Remove GUID pattern
+    folder_name = _strip_guid_suffix(folder_name)
+    # Strip any extra whitespace
+    folder_name = folder_name.strip()
+    # Replace spaces with underscores
+    folder_name = folder_name.replace(' ', '_')
+    return folder_name
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_filename(filename, parent_folder_name=None):
+    """Clean a filename according to rules."""
+    # Remove .md extension temporarily (slice compare beats endswith here)
+    base_name = filename[:-3] if filename[-3:] == '.md' else filename
+
+    # Remove GUID pattern
+    base_name = _strip_guid_suffix(base_name)
+
+    # Strip any extra whitespace
+    base_name = base_name.strip()
+
+    # If this is from a subdirectory, prepend the parent folder name
+    if parent_folder_name:
+        cleaned_parent = _clean_parent_folder_name(parent_folder_name)
+        base_name = f"{cleaned_parent}_{base_name}"
+
+    # Replace remaining spaces with underscores
+    base_name = base_name.replace(' ', '_')
+
+    # Collapse any underscore runs that might have been created
+    base_name = _UNDERSCORE_RUN_RE.sub('_', base_name)
+
+    # Remove any trailing underscores before adding extension
+    base_name = base_name.rstrip('_')
+
+    # Add back .md extension
+    return f"{base_name}.md"
+
+
+def _link_or_copy(src_path, dst_path, use_link):
+    """Hardlink dst to src when both are on the same filesystem, else copy.
+
+    A hardlink is instant and zero-space, and it carries the mtime with
+    it. Exports are never edited in place, so sharing the inode is safe;
+    the link rewrite step replaces files atomically rather than
+    truncating them.
+    """
+    if use_link:
+        try:
+            try:
+                os.link(src_path, dst_path)
+            except FileExistsError:
+                # EAFP: retrying after unlink beats a stat probe per file
+                os.unlink(dst_path)
+                os.link(src_path, dst_path)
+            return
+        except OSError:
+            pass  # Cross-device, permissions, etc. - fall back to a real copy
+    _fast_copy(src_path, dst_path)
+
+
+def _iter_md_files(root_dir, _parts=()):
+    """Yield (parent_parts, DirEntry) for every .md file under root_dir.
+
+    Uses os.scandir so file type comes from the directory read itself,
+    avoiding the extra stat per entry that os.walk incurs. parent_parts
+    holds the directory names below root_dir, outermost first.
+    """
+    try:
+        entries = os.scandir(root_dir)
+    except OSError as e:
+        logging.error(f"Failed to scan directory {root_dir}: {e}")
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_md_files(entry.path, _parts + (entry.name,))
+                elif entry.name[-3:] == '.md':
+                    yield _parts, entry
+            except OSError as e:
+                logging.error(f"Error scanning entry {entry.path}: {e}")
+
+# Set up logging. The file handler opens lazily and sits behind a
+# MemoryHandler so log records hit the disk in batches instead of one
+# write syscall per record; errors still flush immediately.
+_file_handler = logging.FileHandler('file_processor.log', delay=True)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('file_processor.log'),
+        logging.handlers.MemoryHandler(capacity=1000,
+                                       flushLevel=logging.ERROR,
+                                       target=_file_handler),
         logging.StreamHandler()
     ]
 )
@@ -26,6 +190,8 @@ class FileProcessor:
         self.flat_output_dir = os.path.join(self.cwd, flat_output_dir)
         self.files_output_dir = os.path.join(self.cwd, files_output_dir)
         self.filename_mapping = {}  # Dictionary to store original and new filenames
+        self._processed = {}  # src_path -> (mtime_ns, size) of the last copied version
+        self._last_mapping = {}  # Mapping snapshot the _processed cache was built under
         self.setup_output_directories()
 
     def setup_output_directories(self):
@@ -39,9 +205,17 @@ class FileProcessor:
             raise
 
     def extract_title_from_content(self, content):
-        """Extract title from markdown content."""
+        """Extract title from markdown content (a head slice is sufficient)."""
+        # Fast path: a '# Title' on the first line needs no regex at all
+        if content.startswith('# '):
+            end = content.find('\n')
+            first_line = content[2:] if end == -1 else content[2:end]
+            title = first_line.strip()
+            if title:
+                return title
+
         # Look for # Title or # Header pattern
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        title_match = _TITLE_RE.search(content)
         if title_match:
             return title_match.group(1).strip()
 
@@ -49,40 +223,73 @@ class FileProcessor:
         first_line = content.strip().split('\n')[0].strip()
         if first_line:
             # Remove any markdown heading characters
-            return re.sub(r'^#+\s*', '', first_line)
+            return _HEADING_PREFIX_RE.sub('', first_line)
 
         return None
 
     def combine_files_with_titles(self):
         """Combine all markdown files into one with title delimiters."""
         try:
-            combined_content = []
-
-            # Walk through the data directory
-            for root, _, files in os.walk(self.data_dir):
-                for file in files:
-                    if file.endswith('.md'):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-
-                                # Extract title from content
-                                title = self.extract_title_from_content(content)
-                                if not title:
-                                    # Use filename as fallback
-                                    title = os.path.splitext(file)[0]
-
-                                # Add delimited content
-                                combined_content.append(f"--- {title} ---\n{content.strip()}\n")
+            # Sort for deterministic output, then stream file by file so peak
+            # memory stays at one buffer instead of the whole export
+            paths = sorted(entry.path for _, entry in _iter_md_files(self.data_dir))
 
-                        except Exception as e:
-                            logging.error(f"Error processing file {file}: {e}")
-
-            # Write combined content to output file
             output_file = os.path.join(self.files_output_dir, 'combined.md')
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(combined_content))
+            out_fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                first = True
+                for path in paths:
+                    try:
+                        in_fd = os.open(path, os.O_RDONLY)
+                        try:
+                            # Titles live near the top, so a head slice is
+                            # enough - and it's the only decode we do
+                            head = os.read(in_fd, 2048)
+
+                            # Extract title from content
+                            title = self.extract_title_from_content(
+                                head.decode('utf-8', 'replace'))
+                            if not title:
+                                # Use filename as fallback (the walk only
+                                # yields .md files, so slicing is safe)
+                                title = path.rpartition(os.sep)[2][:-3]
+
+                            header = b'' if first else b'\n'
+                            first = False
+                            header += f"--- {title} ---\n".encode('utf-8')
+
+                            if len(head) < 2048:
+                                # Whole file fit in the head slice: one write
+                                os.write(out_fd, header + head.strip() + b'\n')
+                                continue
+
+                            os.write(out_fd, header + head.lstrip())
+                            # Drain the rest in the kernel - no userspace
+                            # buffer, no decode
+                            size = os.fstat(in_fd).st_size
+                            offset = len(head)
+                            try:
+                                while offset < size:
+                                    sent = os.sendfile(out_fd, in_fd, offset,
+                                                       size - offset)
+                                    if sent == 0:
+                                        break
+                                    offset += sent
+                            except (AttributeError, OSError):
+                                os.lseek(in_fd, offset, os.SEEK_SET)
+                                while True:
+                                    chunk = os.read(in_fd, _COPY_BUFSIZE)
+                                    if not chunk:
+                                        break
+                                    os.write(out_fd, chunk)
+                            os.write(out_fd, b'\n')
+                        finally:
+                            os.close(in_fd)
+
+                    except Exception as e:
+                        logging.error(f"Error processing file {os.path.basename(path)}: {e}")
+            finally:
+                os.close(out_fd)
 
             logging.info(f"Created combined file at: {output_file}")
 
@@ -92,42 +299,11 @@ class FileProcessor:
 
     def clean_parent_folder_name(self, folder_name):
         """Clean parent folder name according to rules."""
-        # Remove GUID pattern
-        folder_name = re.sub(r'\s+[a-f0-9]{32}$', '', folder_name)
-        # Strip any extra whitespace
-        folder_name = folder_name.strip()
-        # Replace spaces with underscores
-        folder_name = folder_name.replace(' ', '_')
-        return folder_name
+        return _clean_parent_folder_name(folder_name)
 
     def clean_filename(self, filename, parent_folder_name=None):
         """Clean filename according to rules."""
-        # Remove .md extension temporarily
-        base_name = filename[:-3] if filename.endswith('.md') else filename
-
-        # Remove GUID pattern
-        base_name = re.sub(r'\s+[a-f0-9]{32}$', '', base_name)
-
-        # Strip any extra whitespace
-        base_name = base_name.strip()
-
-        # If this is from a subdirectory, prepend the parent folder name
-        if parent_folder_name:
-            cleaned_parent = self.clean_parent_folder_name(parent_folder_name)
-            base_name = f"{cleaned_parent}_{base_name}"
-
-        # Replace remaining spaces with underscores
-        base_name = base_name.replace(' ', '_')
-
-        # Remove any double underscores that might have been created
-        while '__' in base_name:
-            base_name = base_name.replace('__', '_')
-
-        # Remove any trailing underscores before adding extension
-        base_name = base_name.rstrip('_')
-
-        # Add back .md extension
-        return f"{base_name}.md"
+        return _clean_filename(filename, parent_folder_name)
 
     def save_mapping(self):
         """Save the filename mapping to a file."""
@@ -141,121 +317,172 @@ class FileProcessor:
             logging.error(f"Failed to save filename mapping: {e}")
             raise
 
-    def process_files(self):
-        """Process all files in the data directory."""
+    def process_all(self):
+        """Process the data directory in one fused pass.
+
+        Phase 1 walks the tree collecting filenames only, so the complete
+        mapping exists before any content is read. Phase 2 reads each
+        source once, rewrites its links in memory, and writes the result
+        straight to the flat output - one read and one write per file
+        instead of copy, re-read and rewrite.
+        """
         try:
             if not os.path.exists(self.data_dir):
                 logging.error(f"Data directory not found: {self.data_dir}")
                 raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
 
-            # Process files for flat directory
-            for root, _, files in os.walk(self.data_dir):
-                path_parts = Path(root).relative_to(self.data_dir).parts
-                for file in files:
-                    if file.endswith('.md'):
-                        try:
-                            # Create the new filename
-                            new_filename = self.clean_filename(
-                                file,
-                                path_parts[-1] if len(path_parts) > 0 else None
-                            )
-                            src_path = os.path.join(root, file)
-                            dst_path = os.path.join(self.flat_output_dir, new_filename)
-
-                            # Track the original and new filenames
-                            self.filename_mapping[file] = new_filename
-
-                            # Copy file and preserve modification time
-                            shutil.copy2(src_path, dst_path)
-                            logging.info(f"Processed: {file} -> {new_filename}")
-
-                        except Exception as e:
-                            logging.error(f"Error processing file {file}: {e}")
+            # Phase 1: build the mapping up front (names only, no content)
+            out_dev = os.stat(self.flat_output_dir).st_dev
+            flat_prefix = self.flat_output_dir + os.sep
+            found = []
+            for parent_parts, entry in _iter_md_files(self.data_dir):
+                file = entry.name
+                try:
+                    # Create the new filename
+                    new_filename = self.clean_filename(
+                        file,
+                        parent_parts[-1] if parent_parts else None
+                    )
+                    # Plain concatenation: the prefix is absolute and the new
+                    # name is a bare filename, so no join normalization needed
+                    dst_path = flat_prefix + new_filename
+
+                    # Track the original and new filenames
+                    self.filename_mapping[file] = new_filename
+
+                    found.append((entry, file, new_filename, dst_path))
+                except Exception as e:
+                    logging.error(f"Error processing file {file}: {e}")
+
+            # The rewrite's output depends on the mapping, not just the
+            # source bytes, so an "unchanged" source still needs rewriting
+            # when the mapping has changed (e.g. a new page some old file
+            # links to). Invalidate the skip cache on any mapping change.
+            if self.filename_mapping != self._last_mapping:
+                self._processed.clear()
+                self._last_mapping = dict(self.filename_mapping)
+
+            tasks = []
+            for entry, file, new_filename, dst_path in found:
+                try:
+                    # Skip sources unchanged since the last run (the stat is
+                    # free - scandir already fetched it with the dirent)
+                    st = entry.stat()
+                    signature = (st.st_mtime_ns, st.st_size)
+                    if self._processed.get(entry.path) == signature:
+                        continue
+
+                    use_link = st.st_dev == out_dev
+                    times = (st.st_atime_ns, st.st_mtime_ns)
+                    tasks.append((entry.path, dst_path, use_link, times,
+                                  file, new_filename, signature))
+                except Exception as e:
+                    logging.error(f"Error processing file {file}: {e}")
 
             # Save the filename mapping
             self.save_mapping()
 
-            # Create combined file
+            # Precompute the URL-encoded lookup table once for the whole run
+            # (bytes-keyed - the rewrite operates on raw file bytes)
+            encoded_map = {urllib.parse.quote(original).encode('utf-8'): new.encode('utf-8')
+                           for original, new in self.filename_mapping.items()}
+
+            # Phase 2: transforms are independent per file, so overlap the I/O
+            with ThreadPoolExecutor(max_workers=_MAX_IO_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._transform_file, src, dst, use_link,
+                                    times, encoded_map):
+                        (src, file, new, signature)
+                    for src, dst, use_link, times, file, new, signature in tasks
+                }
+                processed_count = 0
+                for future in as_completed(futures):
+                    src_path, file, new_filename, signature = futures[future]
+                    try:
+                        future.result()
+                        self._processed[src_path] = signature
+                        processed_count += 1
+                        # Per-file detail only at DEBUG; lazy %-formatting so
+                        # the message is never built when it would be dropped
+                        logging.debug("Processed: %s -> %s", file, new_filename)
+                    except Exception as e:
+                        logging.error(f"Error processing file {file}: {e}")
+
+            logging.info("Processed %d files (%d unchanged)",
+                         processed_count,
+                         len(self.filename_mapping) - processed_count)
+
+            # Create combined file, then fix its links too
             self.combine_files_with_titles()
+            combined_file = os.path.join(self.files_output_dir, 'combined.md')
+            if os.path.exists(combined_file):
+                self.update_links_in_file(combined_file, self.filename_mapping, encoded_map)
 
         except Exception as e:
             logging.error(f"Error during file processing: {e}")
             raise
 
-    def read_mapping(self):
-        """Read the filename mapping from the mapping file."""
-        mapping_file_path = os.path.join(self.flat_output_dir, "mapping.txt")
-        mapping = {}
-        try:
-            with open(mapping_file_path, "r") as mapping_file:
-                for line in mapping_file:
-                    original, new = line.strip().split(" -> ")
-                    mapping[original] = new
-            logging.info(f"Filename mapping read from: {mapping_file_path}")
-        except Exception as e:
-            logging.error(f"Failed to read filename mapping: {e}")
-            raise
-        return mapping
-
-    def delete_mapping_file(self):
-        """Delete the mapping file after processing is complete."""
-        try:
-            mapping_file_path = os.path.join(self.flat_output_dir, "mapping.txt")
-            if os.path.exists(mapping_file_path):
-                os.remove(mapping_file_path)
-                logging.info(f"Deleted mapping file: {mapping_file_path}")
-            else:
-                logging.warning(f"Mapping file not found at: {mapping_file_path}")
-        except Exception as e:
-            logging.error(f"Failed to delete mapping file: {e}")
-            raise
+    def _transform_file(self, src_path, dst_path, use_link, times, encoded_map):
+        """Write src to dst with its links rewritten, in one read and one write.
+
+        Works on raw bytes end to end: reading binary skips the
+        TextIOWrapper decode and the rewrite never re-encodes the file.
+        times carries the source (atime_ns, mtime_ns) from the walk, so
+        no extra stat is needed here.
+        """
+        with open(src_path, 'rb') as f:
+            content = f.read()
+
+        new_content = self._rewrite_links(content, self.filename_mapping, encoded_map)
+        if new_content == content:
+            # Nothing to rewrite - the hardlink/copy path is cheaper
+            _link_or_copy(src_path, dst_path, use_link)
+            return
 
-    def process_links(self):
-        """Process links in all output markdown files."""
+        tmp_path = f"{dst_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(new_content)
+        os.utime(tmp_path, ns=times)
+        os.replace(tmp_path, dst_path)
+
+    def _rewrite_links(self, content, mapping, encoded_map):
+        """Return content (bytes) with every markdown link mapped to its new name."""
+        def rewrite(match):
+            link = match.group(1)
+            # A direct hit on the URL-encoded basename needs no decode at all
+            new_filename = encoded_map.get(link.rpartition(b'/')[2])
+            if new_filename is None:
+                # Decode the URL
+                decoded_link = urllib.parse.unquote(link.decode('utf-8'))
+                filename = decoded_link.rpartition('/')[2]
+                new = mapping.get(filename)
+                new_filename = new.encode('utf-8') if new is not None else None
+            if new_filename is None:
+                return match.group(0)
+            # Replace with the new filename from mapping
+            return match.group(0).replace(link, new_filename)
+
+        # One regex pass over the whole content handles every link
+        return _LINK_RE_B.sub(rewrite, content)
+
+    def update_links_in_file(self, file_path, mapping, encoded_map=None):
+        """Update links in a single file."""
+        if encoded_map is None:
+            encoded_map = {urllib.parse.quote(original).encode('utf-8'): new.encode('utf-8')
+                           for original, new in mapping.items()}
         try:
-            mapping = self.read_mapping()
-            if not mapping:
-                logging.error("No mapping available to process links.")
-                return
-
-            # Process links in flat directory
-            for file in os.listdir(self.flat_output_dir):
-                if file.endswith('.md'):
-                    self.update_links_in_file(os.path.join(self.flat_output_dir, file), mapping)
-
-            # Process links in combined file
-            combined_file = os.path.join(self.files_output_dir, 'combined.md')
-            if os.path.exists(combined_file):
-                self.update_links_in_file(combined_file, mapping)
+            with open(file_path, 'rb') as md_file:
+                content = md_file.read()
 
-            # Delete the mapping file after processing is complete
-            self.delete_mapping_file()
+            new_content = self._rewrite_links(content, mapping, encoded_map)
 
-        except Exception as e:
-            logging.error(f"Error processing links: {e}")
-            raise
-
-    def update_links_in_file(self, file_path, mapping):
-        """Update links in a single file."""
-        try:
-            new_lines = []
-            with open(file_path, 'r') as md_file:
-                for line in md_file:
-                    # Extract links from the line
-                    matches = re.findall(r'\[.*?\]\((.*?)\)', line)
-                    for match in matches:
-                        # Decode the URL
-                        decoded_link = urllib.parse.unquote(match)
-                        filename = os.path.basename(decoded_link)
-                        if filename in mapping:
-                            # Replace with the new filename from mapping
-                            new_filename = mapping[filename]
-                            line = line.replace(match, new_filename)
-                    new_lines.append(line)
-
-            # Write updated lines back to the file
-            with open(file_path, 'w') as md_file:
-                md_file.writelines(new_lines)
+            # Replace rather than truncate: output files may be hardlinks
+            # into the data directory, and a replace breaks the link instead
+            # of overwriting the shared inode
+            tmp_path = f"{file_path}.tmp"
+            with open(tmp_path, 'wb') as md_file:
+                md_file.write(new_content)
+            os.replace(tmp_path, file_path)
 
             logging.info(f"Updated links in: {file_path}")
         except Exception as e:
@@ -274,31 +501,50 @@ class Watcher:
         self.observer.schedule(event_handler, self.directory_to_watch, recursive=True)
         self.observer.start()
         try:
-            while True:
-                pass  # Keep running
+            # Block on the observer thread instead of busy-waiting a core
+            self.observer.join()
         except KeyboardInterrupt:
             self.observer.stop()
         self.observer.join()
 
 
 class Handler(FileSystemEventHandler):
+    # Wait this long after the last event before reprocessing, so a burst
+    # of files from one export collapses into a single run
+    DEBOUNCE_SECONDS = 2.0
+
     def __init__(self, processor):
         self.processor = processor
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        self._run_lock = threading.Lock()
 
     def on_any_event(self, event):
         if event.is_directory or not event.src_path.endswith('.md'):
             return
-        # Run the processing when changes are detected
-        self.processor.process_files()
-        self.processor.process_links()
+        # Restart the quiescence timer; processing runs once the burst ends
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._run_processing)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run_processing(self):
+        # Run the processing once the directory has gone quiet. Each timer
+        # fires on its own thread, and a run can outlast the quiescence
+        # window, so serialize: the processor's state (filename_mapping,
+        # _processed) is not safe to mutate concurrently. A timer that
+        # fires mid-run simply runs again afterwards, picking up whatever
+        # arrived in the meantime.
+        with self._run_lock:
+            self.processor.process_all()
 
 
 def main():
     try:
         processor = FileProcessor()
-        processor.process_files()
-        # Process links in the output files
-        processor.process_links()
+        processor.process_all()
         logging.info("File processing completed successfully")
 
         # Start watching the data directory for changes
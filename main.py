@@ -1,27 +1,119 @@
+import functools
+import json
+import mmap
 import os
 import shutil
 import re
 import logging
+import logging.handlers
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
-# Set up logging
+# Pre-compiled patterns; calling sub/findall on the compiled objects skips
+# the per-call cache lookup in re.sub/re.findall
+# Date prefix and GUID suffix removal fused into one alternation: names are
+# short, so one scan instead of two roughly halves the regex cost per name
+_CLEAN_RE = re.compile(
+    r'(?P<date>\d{2}[\s_]+\d{2}[\s_]+\d{4}[\s_]*-[\s_]*)'
+    r'|(?P<guid>\s+[a-f0-9]{32}$)')
+_LINK_RE = re.compile(r'\[.*?\]\((.*?)\)')
+_MULTI_US_RE = re.compile(r'_{2,}')
+
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+def _strip_guid_suffix(name):
+    """Strip a trailing whitespace + 32-hex-char GUID with string ops.
+
+    The GUID pattern is anchored and fixed-width, so a slice check settles
+    the common cases (no GUID, or one space before it) without invoking
+    the regex engine; callers still run _CLEAN_RE afterwards, which covers
+    dates and any GUID with unusual whitespace.
+    """
+    if (len(name) >= 33 and _HEX_DIGITS.issuperset(name[-32:])
+            and name[-33].isspace()):
+        return name[:-33].rstrip()
+    return name
+
+# Translation table for the space -> underscore substitution; str.translate
+# beats str.replace for single-character swaps
+_SPACE_TO_US = str.maketrans({' ': '_'})
+
+# Set up logging. The file handler sits behind a MemoryHandler so records
+# reach the disk in batches rather than one write per record; errors still
+# flush immediately.
+_file_handler = logging.FileHandler('file_processor.log', delay=True)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('file_processor.log'),
+        logging.handlers.MemoryHandler(capacity=1024,
+                                       flushLevel=logging.ERROR,
+                                       target=_file_handler),
         logging.StreamHandler()
     ]
 )
 
 
+# Copies are I/O bound and release the GIL in the kernel, so oversubscribe
+# relative to the core count
+_MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@functools.lru_cache(maxsize=8192)
+def _quote_filename(filename):
+    """URL-encode a filename, memoized - mappings repeat across runs."""
+    return urllib.parse.quote(filename)
+
+
+def _copy_with_mtime(src_path, dst_path):
+    """Copy src to dst preserving its timestamps.
+
+    shutil.copyfile takes the os.copy_file_range/sendfile fast path on
+    Linux; a single stat + utime replaces copy2's full copystat, which
+    probes xattrs and ACLs with several extra syscalls per file.
+    """
+    shutil.copyfile(src_path, dst_path)
+    st = os.stat(src_path)
+    os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _iter_md_files(root_dir, _depth=0):
+    """Yield (DirEntry, parent_folder_name) for every .md file under root_dir.
+
+    os.scandir fills in the file type from the directory read itself, so
+    unlike os.walk no extra stat is issued per entry. parent_folder_name
+    is only set for files two levels below the data dir, matching the old
+    depth check on Path.relative_to(...).parts.
+    """
+    try:
+        entries = os.scandir(root_dir)
+    except OSError as e:
+        logging.error(f"Failed to scan directory {root_dir}: {e}")
+        return
+    # The depth is structural, so the parent name is known once per
+    # directory rather than recomputed per file
+    parent = os.path.basename(root_dir) if _depth == 2 else None
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_md_files(entry.path, _depth + 1)
+                elif entry.name.endswith('.md'):
+                    yield entry, parent
+            except OSError as e:
+                logging.error(f"Error scanning entry {entry.path}: {e}")
+
+
 class FileProcessor:
     def __init__(self, data_dir="data", output_dir="output"):
-        self.cwd = os.getcwd()
-        self.data_dir = os.path.join(self.cwd, data_dir)
-        self.output_dir = os.path.join(self.cwd, output_dir)
+        # One getcwd syscall; Path reuses the parsed segments for joins
+        self.cwd = Path.cwd()
+        self.data_dir = self.cwd / data_dir
+        self.output_dir = self.cwd / output_dir
         self.filename_mapping = {}  # Dictionary to store original and new filenames
 
     def setup_output_directory(self):
@@ -35,41 +127,43 @@ class FileProcessor:
 
     def clean_parent_folder_name(self, folder_name):
         """Clean parent folder name according to rules."""
-        # Remove date pattern (handle both space and underscore formats)
-        folder_name = re.sub(r'\d{2}[\s_]+\d{2}[\s_]+\d{4}[\s_]*-[\s_]*', '', folder_name)
-        # Remove GUID pattern
-        folder_name = re.sub(r'\s+[a-f0-9]{32}$', '', folder_name)
+        # Remove GUID suffix on the string fast path, then date pattern
+        # (both space and underscore formats) plus any leftover GUID
+        folder_name = _strip_guid_suffix(folder_name)
+        folder_name = _CLEAN_RE.sub('', folder_name)
         # Strip any extra whitespace
         folder_name = folder_name.strip()
         # Replace spaces with underscores
-        folder_name = folder_name.replace(' ', '_')
+        folder_name = folder_name.translate(_SPACE_TO_US)
         return folder_name
 
-    def clean_filename(self, filename, parent_folder_name=None):
-        """Clean filename according to rules."""
+    def clean_filename(self, filename, cleaned_parent_name=None):
+        """Clean filename according to rules.
+
+        cleaned_parent_name must already have been through
+        clean_parent_folder_name; callers clean it once per directory
+        instead of once per file.
+        """
         # Remove .md extension temporarily
         base_name = filename[:-3] if filename.endswith('.md') else filename
 
-        # Remove date pattern (handle both space and underscore formats)
-        base_name = re.sub(r'\d{2}[\s_]+\d{2}[\s_]+\d{4}[\s_]*-[\s_]*', '', base_name)
-
-        # Remove GUID pattern
-        base_name = re.sub(r'\s+[a-f0-9]{32}$', '', base_name)
+        # Remove GUID suffix on the string fast path, then date pattern
+        # (both space and underscore formats) plus any leftover GUID
+        base_name = _strip_guid_suffix(base_name)
+        base_name = _CLEAN_RE.sub('', base_name)
 
         # Strip any extra whitespace
         base_name = base_name.strip()
 
         # If this is from a subdirectory, prepend the parent folder name
-        if parent_folder_name:
-            cleaned_parent = self.clean_parent_folder_name(parent_folder_name)
-            base_name = f"{cleaned_parent}_{base_name}"
+        if cleaned_parent_name:
+            base_name = f"{cleaned_parent_name}_{base_name}"
 
         # Replace remaining spaces with underscores
-        base_name = base_name.replace(' ', '_')
+        base_name = base_name.translate(_SPACE_TO_US)
 
-        # Remove any double underscores that might have been created
-        while '__' in base_name:
-            base_name = base_name.replace('__', '_')
+        # Collapse any underscore runs that might have been created
+        base_name = _MULTI_US_RE.sub('_', base_name)
 
         # Remove any trailing underscores before adding extension
         base_name = base_name.rstrip('_')
@@ -80,10 +174,11 @@ class FileProcessor:
     def save_mapping(self):
         """Save the filename mapping to a file."""
         try:
-            mapping_file_path = os.path.join(self.output_dir, "mapping.txt")
+            mapping_file_path = os.path.join(self.output_dir, "mapping.json")
+            # JSON round-trips in one C-level pass and survives filenames
+            # that happen to contain the old ' -> ' separator
             with open(mapping_file_path, "w") as mapping_file:
-                for original, new in self.filename_mapping.items():
-                    mapping_file.write(f"{original} -> {new}\n")
+                json.dump(self.filename_mapping, mapping_file, indent=2)
             logging.info(f"Filename mapping saved to: {mapping_file_path}")
         except Exception as e:
             logging.error(f"Failed to save filename mapping: {e}")
@@ -98,40 +193,59 @@ class FileProcessor:
                 logging.error(f"Data directory not found: {self.data_dir}")
                 raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
 
-            for root, dirs, files in os.walk(self.data_dir):
-                # Get the parent folder name if we're in a subdirectory
-                path_parts = Path(root).relative_to(self.data_dir).parts
-                parent_folder_name = None
-
-                if len(path_parts) == 2:  # We're in a subdirectory
-                    # Get the immediate parent directory name (the one with Event Bridge)
-                    parent_folder = os.path.basename(root)
-                    parent_folder_name = parent_folder
-
-                for file in files:
-                    if file.endswith('.md'):
-                        try:
-                            # Create the new filename
-                            new_filename = self.clean_filename(file, parent_folder_name)
-                            src_path = os.path.join(root, file)
-                            dst_path = os.path.join(self.output_dir, new_filename)
-
-                            # Track the original and new filenames
-                            self.filename_mapping[file] = new_filename
-
-                            # Check if destination file already exists
-                            if os.path.exists(dst_path):
-                                logging.warning(f"File already exists, skipping: {dst_path}")
-                                continue
-
-                            # Copy file and preserve modification time
-                            shutil.copy2(src_path, dst_path)
-                            logging.info(f"Processed: {file} -> {new_filename}")
-
-                        except PermissionError as e:
-                            logging.error(f"Permission error processing file {file}: {e}")
-                        except Exception as e:
-                            logging.error(f"Error processing file {file}: {e}")
+            # One scan of the output dir replaces a stat probe per file
+            with os.scandir(self.output_dir) as it:
+                existing = {e.name for e in it}
+
+            # Each parent folder is cleaned once, no matter how many files share it
+            cleaned_parents = {}
+
+            # Build the full mapping in this thread first; the workers only copy
+            tasks = []
+            for entry, parent_folder_name in _iter_md_files(self.data_dir):
+                file = entry.name
+                try:
+                    cleaned_parent_name = None
+                    if parent_folder_name:
+                        cleaned_parent_name = cleaned_parents.get(parent_folder_name)
+                        if cleaned_parent_name is None:
+                            cleaned_parent_name = self.clean_parent_folder_name(parent_folder_name)
+                            cleaned_parents[parent_folder_name] = cleaned_parent_name
+
+                    # Create the new filename
+                    new_filename = self.clean_filename(file, cleaned_parent_name)
+                    dst_path = os.path.join(self.output_dir, new_filename)
+
+                    # Track the original and new filenames
+                    self.filename_mapping[file] = new_filename
+
+                    # Check if destination file already exists
+                    if new_filename in existing:
+                        logging.warning("File already exists, skipping: %s", dst_path)
+                        continue
+                    existing.add(new_filename)
+
+                    tasks.append((entry.path, dst_path, file, new_filename))
+                except Exception as e:
+                    logging.error(f"Error processing file {file}: {e}")
+
+            # The copies are independent per file, so overlap the I/O
+            with ThreadPoolExecutor(max_workers=_MAX_COPY_WORKERS) as executor:
+                futures = {
+                    executor.submit(_copy_with_mtime, src, dst): (file, new)
+                    for src, dst, file, new in tasks
+                }
+                for future in as_completed(futures):
+                    file, new_filename = futures[future]
+                    try:
+                        future.result()
+                        # Lazy %-args: the string is only built if a handler
+                        # actually emits the record
+                        logging.info("Processed: %s -> %s", file, new_filename)
+                    except PermissionError as e:
+                        logging.error(f"Permission error processing file {file}: {e}")
+                    except Exception as e:
+                        logging.error(f"Error processing file {file}: {e}")
 
             # Save the filename mapping
             self.save_mapping()
@@ -142,47 +256,72 @@ class FileProcessor:
 
     def read_mapping(self):
         """Read the filename mapping from the mapping file."""
-        mapping_file_path = os.path.join(self.output_dir, "mapping.txt")
-        mapping = {}
+        mapping_file_path = os.path.join(self.output_dir, "mapping.json")
         try:
             with open(mapping_file_path, "r") as mapping_file:
-                for line in mapping_file:
-                    original, new = line.strip().split(" -> ")
-                    mapping[original] = new
+                mapping = json.load(mapping_file)
             logging.info(f"Filename mapping read from: {mapping_file_path}")
         except Exception as e:
             logging.error(f"Failed to read filename mapping: {e}")
             raise
         return mapping
 
-    def process_links(self):
+    def process_links(self, mapping=None):
         """Process links in all output markdown files and rewrite them with correct filenames."""
         try:
-            mapping = self.read_mapping()
+            if mapping is None:
+                # The mapping from process_files is already in memory; only
+                # go back to disk when invoked standalone
+                mapping = self.filename_mapping or self.read_mapping()
+            if not mapping:
+                logging.warning("No filename mapping available; skipping link rewrite")
+                return
+
+            # Multi-string replacement in a single scan: one alternation of
+            # every known basename - URL-encoded, the form Notion writes
+            # into markdown links, plus the raw form. The match is anchored
+            # to the [text](target) link syntax and the key must span the
+            # whole final path segment (preceded by the opening paren or a
+            # slash), so a mapped name that is merely a suffix of a longer
+            # basename never fires. Longest-first so overlapping names
+            # resolve deterministically. The whole target (directory prefix
+            # and all) is replaced by the flat output name, as before.
+            # Bytes throughout: the regex runs directly over the mmap'ed
+            # file with no decode, and the result is written back raw
+            replacements = {}
+            for original, new in mapping.items():
+                replacements[_quote_filename(original).encode('utf-8')] = new.encode('utf-8')
+                replacements[original.encode('utf-8')] = new.encode('utf-8')
+            alternation = b'|'.join(
+                re.escape(key) for key in sorted(replacements, key=len, reverse=True))
+            finder = re.compile(
+                rb'(\[.*?\])\((?:[^()]*/)?(' + alternation + rb')\)')
+
+            def rewrite(match):
+                # The whole target collapses to the new flat filename,
+                # directory prefix included
+                return match.group(1) + b'(' + replacements[match.group(2)] + b')'
+
             for root, _, files in os.walk(self.output_dir):
                 for file in files:
                     if file.endswith('.md'):
                         file_path = os.path.join(root, file)
-                        new_lines = []
-                        with open(file_path, 'r') as md_file:
-                            for line in md_file:
-                                # Extract links from the line (assuming markdown link format)
-                                matches = re.findall(r'\[.*?\]\((.*?)\)', line)
-                                for match in matches:
-                                    # Decode the URL
-                                    decoded_link = urllib.parse.unquote(match)
-                                    filename = os.path.basename(decoded_link)
-                                    if filename in mapping:
-                                        # Replace with the new filename from mapping
-                                        new_filename = mapping[filename]
-                                        line = line.replace(match, new_filename)
-                                new_lines.append(line)
-
-                        # Write updated lines back to the file
-                        with open(file_path, 'w') as md_file:
-                            md_file.writelines(new_lines)
-
-                        logging.info(f"Updated links in: {file_path}")
+                        with open(file_path, 'rb') as md_file:
+                            try:
+                                buf = mmap.mmap(md_file.fileno(), 0,
+                                                access=mmap.ACCESS_READ)
+                            except ValueError:
+                                continue  # Empty files cannot be mapped
+                            with buf:
+                                # One scan over the mapped file handles
+                                # every link; subn says whether anything hit
+                                new_content, hits = finder.subn(rewrite, buf)
+
+                        # Skip the write entirely when nothing changed
+                        if hits:
+                            with open(file_path, 'wb') as md_file:
+                                md_file.write(new_content)
+                            logging.info("Updated links in: %s", file_path)
         except Exception as e:
             logging.error(f"Error processing links: {e}")
             raise
@@ -193,7 +332,7 @@ def main():
         processor = FileProcessor()
         processor.process_files()
         # Process links in the output files
-        processor.process_links()
+        processor.process_links(mapping=processor.filename_mapping)
         logging.info("File processing completed successfully")
     except Exception as e:
         logging.error(f"Program failed: {e}")
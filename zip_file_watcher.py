@@ -1,10 +1,26 @@
 import os
 import logging
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# Prefer the inotify backend directly: it delivers IN_CLOSE_WRITE, which
+# fires once a writer has finished, so we never open a half-written zip
+try:
+    from watchdog.observers.inotify import InotifyObserver as Observer
+    _HAS_CLOSE_EVENTS = True
+except ImportError:
+    from watchdog.observers import Observer
+    _HAS_CLOSE_EVENTS = False
+
+# zlib releases the GIL while inflating, so decompression scales with cores
+_MAX_EXTRACT_WORKERS = min(32, (os.cpu_count() or 1))
+
+# Members up to this size are inflated to memory and written with a single
+# write syscall instead of zipfile's chunked copy loop
+_SMALL_MEMBER_BYTES = 1 << 20
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,20 +38,85 @@ class ZipFileHandler(FileSystemEventHandler):
         self.processed_files = set()
 
     def on_created(self, event):
-        if event.is_directory:
+        if _HAS_CLOSE_EVENTS:
+            # inotify reports IN_CLOSE_WRITE once a streamed zip is
+            # complete, but a zip moved in from outside the watch dir
+            # surfaces as a bare creation and never emits a close event.
+            # Extract on creation only when the archive is already whole;
+            # a file still being written fails the end-of-central-directory
+            # check here and is picked up by on_closed instead (the
+            # processed_files set keeps the two paths from both firing)
+            if (event.is_directory
+                    or not event.src_path.endswith('.zip')
+                    or not zipfile.is_zipfile(event.src_path)):
+                return
+        self._handle_file(event.src_path, event.is_directory)
+
+    def on_closed(self, event):
+        # Fires once per completed write on the inotify backend
+        self._handle_file(event.src_path, event.is_directory)
+
+    def on_moved(self, event):
+        # A zip renamed or moved into the watch dir emits no close event
+        self._handle_file(event.dest_path, event.is_directory)
+
+    def _handle_file(self, file_path, is_directory):
+        if is_directory:
             return
 
-        file_path = event.src_path
         if file_path.endswith('.zip') and file_path not in self.processed_files:
             self.processed_files.add(file_path)
             self.extract_zip_file(file_path)
 
     def extract_zip_file(self, zip_path):
-        """Extract the zip file to the data directory."""
+        """Extract the zip file to the data directory.
+
+        Members decompress in parallel - zlib releases the GIL while
+        inflating - with one ZipFile handle per worker, since sharing a
+        single handle's file position across threads is not safe.
+        """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.data_dir)
-                logging.info(f"Extracted: {zip_path} to {self.data_dir}")
+                members = zip_ref.infolist()
+
+            # Pre-create the directory tree serially; zipfile's own
+            # makedirs-on-demand is racy across threads. Skip absolute or
+            # parent-relative names here - joining them would escape
+            # data_dir - and leave them to zf.extract, which sanitizes
+            for member in members:
+                name = member.filename
+                if name.startswith('/') or '..' in name.split('/'):
+                    continue
+                dirname = os.path.dirname(name)
+                if dirname:
+                    os.makedirs(os.path.join(self.data_dir, dirname), exist_ok=True)
+
+            def extract_members(chunk):
+                with zipfile.ZipFile(zip_path, 'r') as zf:
+                    for member in chunk:
+                        name = member.filename
+                        if (member.is_dir()
+                                or member.file_size > _SMALL_MEMBER_BYTES
+                                or name.startswith('/')
+                                or '..' in name.split('/')):
+                            # Large or suspicious paths go through zipfile's
+                            # own chunked, sanitizing extract
+                            zf.extract(member, self.data_dir)
+                            continue
+                        # Small member (the common case for markdown exports):
+                        # inflate to memory, then one open/write/close
+                        data = zf.read(member)
+                        with open(os.path.join(self.data_dir, name), 'wb') as out:
+                            out.write(data)
+
+            workers = min(_MAX_EXTRACT_WORKERS, len(members)) or 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(extract_members, members[i::workers])
+                           for i in range(workers)]
+                for future in futures:
+                    future.result()
+
+            logging.info(f"Extracted: {zip_path} to {self.data_dir}")
         except zipfile.BadZipFile as e:
             logging.error(f"Failed to extract {zip_path}: Bad zip file: {e}")
         except Exception as e:
@@ -43,8 +124,10 @@ class ZipFileHandler(FileSystemEventHandler):
 
 class ZipFileWatcher:
     def __init__(self, watch_dir="watch", data_dir="data"):
-        self.watch_dir = os.path.join(os.getcwd(), watch_dir)
-        self.data_dir = os.path.join(os.getcwd(), data_dir)
+        # One getcwd syscall instead of two, and Path-based joins
+        cwd = Path.cwd()
+        self.watch_dir = cwd / watch_dir
+        self.data_dir = cwd / data_dir
 
     def setup_directories(self):
         """Create watch and data directories if they don't exist."""
@@ -69,13 +152,13 @@ class ZipFileWatcher:
 
         event_handler = ZipFileHandler(self.watch_dir, self.data_dir)
         observer = Observer()
-        observer.schedule(event_handler, self.watch_dir, recursive=False)
+        observer.schedule(event_handler, str(self.watch_dir), recursive=False)
         observer.start()
 
         try:
-            while True:
-                # Keep the script running
-                time.sleep(1)
+            # Block on the observer thread; inotify wakes it on events, so
+            # there is no 1-second poll loop
+            observer.join()
         except KeyboardInterrupt:
             observer.stop()
             logging.info("Stopping watch due to keyboard interrupt.")
@@ -95,5 +178,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    import time
     exit(main())